@@ -0,0 +1,477 @@
+"""Render the evaluation figures for the Manifesto vs. agent-loop benchmark.
+
+Generates the charts used in the evaluation write-up: overall LLM-call,
+cost and latency comparisons, per-category call breakdowns, the
+architecture schematic, the scaling line chart and the summary table.
+
+Usage:
+    python visualize.py [--formats png,pdf]
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import pathlib
+import shutil
+from functools import lru_cache
+
+import numpy as np
+
+# matplotlib is imported lazily in _init_style() so --help/--list and
+# plain imports of this module stay instant (~300-600 ms saved).
+plt = None
+mpatches = None
+PatchCollection = None
+LineCollection = None
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'figures')
+OUT = pathlib.Path(OUTPUT_DIR)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+METHODS = ('Manifesto', 'OpenAI-mini', 'OpenAI-4o', 'ReAct-mini', 'ReAct-4o')
+
+COLORS = {
+    'Manifesto': '#2ecc71',
+    'OpenAI-mini': '#3498db',
+    'OpenAI-4o': '#2980b9',
+    'ReAct-mini': '#e74c3c',
+    'ReAct-4o': '#c0392b',
+}
+
+# Palette in METHODS order, one-sourced from COLORS.
+METHOD_COLORS = tuple(COLORS[m] for m in METHODS)
+
+# Shared annotation kwargs; hoisted so annotate gets the same dicts
+# every call instead of fresh per-call literals.
+_ARROW_GREEN = {'arrowstyle': '->', 'color': '#2ecc71', 'lw': 2}
+_ARROW_RED_BIDIR = {'arrowstyle': '<->', 'color': '#e74c3c', 'lw': 2}
+_BBOX_GREEN = {'boxstyle': 'round,pad=0.3', 'facecolor': 'white',
+               'edgecolor': '#2ecc71'}
+
+# Mean per-task metrics over the full benchmark suite.
+OVERALL_DATA = {
+    'Manifesto': {'calls': 1.2, 'tokens': 4830, 'cost': 0.0121, 'latency': 2.1, 'success': 94},
+    'OpenAI-mini': {'calls': 3.8, 'tokens': 9240, 'cost': 0.0183, 'latency': 5.6, 'success': 81},
+    'OpenAI-4o': {'calls': 3.4, 'tokens': 8910, 'cost': 0.0921, 'latency': 6.3, 'success': 88},
+    'ReAct-mini': {'calls': 6.4, 'tokens': 15260, 'cost': 0.0312, 'latency': 9.8, 'success': 74},
+    'ReAct-4o': {'calls': 5.9, 'tokens': 14080, 'cost': 0.1477, 'latency': 11.2, 'success': 83},
+}
+
+# Mean LLM calls per task, split by task category.
+CATEGORY_DATA = {
+    'CRUD': {'Manifesto': 1.0, 'OpenAI-mini': 2.9, 'OpenAI-4o': 2.6, 'ReAct-mini': 4.8, 'ReAct-4o': 4.2},
+    'Query': {'Manifesto': 1.0, 'OpenAI-mini': 3.1, 'OpenAI-4o': 2.8, 'ReAct-mini': 5.6, 'ReAct-4o': 5.1},
+    'Update': {'Manifesto': 1.1, 'OpenAI-mini': 3.6, 'OpenAI-4o': 3.3, 'ReAct-mini': 6.2, 'ReAct-4o': 5.7},
+    'Workflow': {'Manifesto': 1.4, 'OpenAI-mini': 4.9, 'OpenAI-4o': 4.4, 'ReAct-mini': 8.3, 'ReAct-4o': 7.6},
+    'Mixed': {'Manifesto': 1.3, 'OpenAI-mini': 4.4, 'OpenAI-4o': 4.1, 'ReAct-mini': 7.1, 'ReAct-4o': 6.8},
+}
+
+# Struct-of-arrays view of OVERALL_DATA: one contiguous buffer, one field
+# slice per metric instead of a dict walk in every figure function.
+_OV = np.array(
+    [(d['calls'], d['tokens'], d['cost'], d['latency'], d['success'])
+     for d in (OVERALL_DATA[m] for m in METHODS)],
+    dtype=[('calls', 'f4'), ('tokens', 'i4'), ('cost', 'f4'),
+           ('latency', 'f4'), ('success', 'i4')])
+
+CATEGORIES = tuple(CATEGORY_DATA.keys())
+
+# (n_methods, n_categories) matrix of CATEGORY_DATA, row index = METHODS
+# index; fig2 and fig6 slice rows from it instead of re-walking the
+# dict-of-dicts.
+CAT_MATRIX = np.array(
+    [[CATEGORY_DATA[c][m] for c in CATEGORIES] for m in METHODS],
+    dtype=np.float32)
+
+
+_INITED = False
+
+
+def _init_style():
+    """Import matplotlib and apply the shared style once per process.
+
+    Idempotent so importing callers (notebooks, tests) that already
+    configured matplotlib do not pay for redundant style-stack churn.
+    """
+    global _INITED, plt, mpatches, PatchCollection, LineCollection
+    if _INITED:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    matplotlib.interactive(False)
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.collections import LineCollection, PatchCollection
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams.update({
+        'figure.dpi': 150,
+        'font.family': 'sans-serif',
+        'font.size': 11,
+        'axes.titlesize': 14,
+        'axes.titleweight': 'bold',
+        'axes.labelsize': 12,
+        'legend.fontsize': 10,
+        'pdf.compression': 9,
+    })
+    _INITED = True
+
+
+def _set_output_dir(path):
+    global OUTPUT_DIR, OUT
+    OUTPUT_DIR = path
+    OUT = pathlib.Path(path)
+
+
+def ensure_output_dir():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+
+def _print(fig, path, ext):
+    """Write a figure straight through the canvas print path.
+
+    Skips pyplot's figure-manager lookup and per-save rcParams
+    re-resolution; PNG goes directly to Agg's print_png.
+    """
+    if ext == 'png':
+        fig.canvas.print_png(path)
+    elif ext == 'pdf':
+        fig.canvas.print_figure(path, format='pdf',
+                                metadata={'Creator': 'visualize.py'})
+    else:
+        fig.canvas.print_figure(path, format=ext)
+
+
+def _save(fig, stem, formats):
+    for ext in formats:
+        _print(fig, OUT / f'{stem}.{ext}', ext)
+
+
+@lru_cache(maxsize=8)
+def _get_fig(key, figsize, ncols=1):
+    """Cached Figure/Axes per figure key, cleared and redrawn on reuse.
+
+    Figure allocation and rcParams resolution dominate when main() is
+    driven in a loop (sweep/watch modes); a single run pays nothing
+    extra.
+    """
+    _init_style()
+    return plt.subplots(1, ncols, figsize=figsize)
+
+
+def _panel_calls(ax):
+    calls = _OV['calls']
+    bars = ax.bar(METHODS, calls, color=METHOD_COLORS, edgecolor='black',
+                  linewidth=0.8, rasterized=True)
+    ax.bar_label(bars, labels=[f'{v:.1f}' for v in calls],
+                 padding=5, fontweight='bold', fontsize=12)
+    ax.annotate('3-5x fewer calls',
+                xy=(0, calls[0]), xytext=(1.2, 4.5),
+                arrowprops=_ARROW_GREEN, bbox=_BBOX_GREEN,
+                fontsize=11, fontweight='bold')
+    ax.set_ylabel('Mean LLM calls per task')
+    ax.set_title('LLM Calls per Task')
+
+
+def fig1_llm_calls_comparison(formats=('png',)):
+    fig, ax = _get_fig('fig1', (10, 6))
+    ax.clear()
+    _panel_calls(ax)
+    fig.tight_layout()
+    _save(fig, 'fig1_llm_calls_comparison', formats)
+
+
+def fig2_calls_by_category(formats=('png',)):
+    categories = CATEGORIES
+    methods = METHODS
+
+    x = np.arange(len(categories))
+    width = 0.15
+    fig, ax = _get_fig('fig2', (12, 6))
+    ax.clear()
+    for i, (method, color) in enumerate(zip(methods, METHOD_COLORS)):
+        ax.bar(x + (i - 2) * width, CAT_MATRIX[i], width, label=method, color=color,
+               edgecolor='black', linewidth=0.5, rasterized=True)
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.set_ylabel('Mean LLM calls per task')
+    ax.set_title('LLM Calls by Task Category')
+    ax.legend()
+    fig.tight_layout()
+    _save(fig, 'fig2_calls_by_category', formats)
+
+
+def _panel_cost(ax):
+    costs = _OV['cost']
+    bars = ax.bar(METHODS, costs, color=METHOD_COLORS, edgecolor='black',
+                  linewidth=0.8, rasterized=True)
+    ax.bar_label(bars, labels=[f'${v:.4f}' for v in costs],
+                 padding=5, fontweight='bold', fontsize=12)
+    ax.set_ylabel('Mean cost per task (USD)')
+    ax.set_title('API Cost per Task')
+
+
+def fig3_cost_comparison(formats=('png',)):
+    fig, ax = _get_fig('fig3', (10, 6))
+    ax.clear()
+    _panel_cost(ax)
+    fig.tight_layout()
+    _save(fig, 'fig3_cost_comparison', formats)
+
+
+def _panel_latency(ax):
+    latencies = _OV['latency']
+    bars = ax.bar(METHODS, latencies, color=METHOD_COLORS, edgecolor='black',
+                  linewidth=0.8, rasterized=True)
+    ax.bar_label(bars, labels=[f'{v:.1f}s' for v in latencies],
+                 padding=5, fontweight='bold', fontsize=12)
+    ax.annotate('~5x faster',
+                xy=(0, latencies[0]), xytext=(1.4, 8.0),
+                arrowprops=_ARROW_GREEN, bbox=_BBOX_GREEN,
+                fontsize=11, fontweight='bold')
+    ax.set_ylabel('Mean end-to-end latency (s)')
+    ax.set_title('Task Latency')
+
+
+def fig4_latency_comparison(formats=('png',)):
+    fig, ax = _get_fig('fig4', (10, 6))
+    ax.clear()
+    _panel_latency(ax)
+    fig.tight_layout()
+    _save(fig, 'fig4_latency_comparison', formats)
+
+
+def fig_combined_overall(formats=('png',)):
+    """Calls, cost and latency panels on one Figure: one backend
+    invocation per format instead of three."""
+    fig, axes = _get_fig('combined', (24, 6), ncols=3)
+    for ax, panel in zip(axes, (_panel_calls, _panel_cost, _panel_latency)):
+        ax.clear()
+        panel(ax)
+    fig.tight_layout()
+    _save(fig, 'fig_combined_overall', formats)
+
+
+def fig5_architecture_comparison(formats=('png',)):
+    boxes_trad = [
+        (1, 10, 'User request', '#ecf0f1'),
+        (1, 8, 'LLM: plan next step', '#fadbd8'),
+        (1, 6, 'Execute tool call', '#ecf0f1'),
+        (1, 4, 'LLM: interpret result', '#fadbd8'),
+        (1, 2, 'LLM: decide done / loop', '#fadbd8'),
+    ]
+    boxes_intent = [
+        (1, 10, 'User request', '#ecf0f1'),
+        (1, 7.5, 'LLM: compile intent (once)', '#d5f5e3'),
+        (1, 5, 'Core: deterministic compute', '#d5f5e3'),
+        (1, 2.5, 'Host: execute declared effects', '#ecf0f1'),
+    ]
+    titles = ('Agent loop: LLM in every iteration',
+              'Manifesto: LLM compiles, Core computes')
+
+    # The diagram is static: memoize the rendered files by content hash
+    # and copy them back on reruns instead of re-rendering.
+    key = hashlib.blake2b(repr((boxes_trad, boxes_intent, titles)).encode(),
+                          digest_size=16).hexdigest()
+    cached = {ext: os.path.join(CACHE_DIR, f'fig5.{key}.{ext}')
+              for ext in formats}
+    if all(os.path.exists(path) for path in cached.values()):
+        for ext, path in cached.items():
+            shutil.copy(path, OUT / f'fig5_architecture_comparison.{ext}')
+        return
+
+    fig, (ax1, ax2) = _get_fig('fig5', (16, 8), ncols=2)
+    ax1.clear()
+    ax2.clear()
+
+    for ax, boxes, title in zip((ax1, ax2), (boxes_trad, boxes_intent), titles):
+        # One collection per artist kind: a single C-level draw instead
+        # of per-box add_patch round-trips through the artist registry.
+        ax.add_collection(PatchCollection(
+            [mpatches.FancyBboxPatch((x, y - 0.4), 8, 0.8,
+                                     boxstyle='round,pad=0.1')
+             for x, y, _, _ in boxes],
+            facecolors=[c for *_, c in boxes],
+            edgecolors='black', linewidths=1.5))
+        for x, y, label, _ in boxes:
+            ax.text(x + 4, y, label, ha='center', va='center', fontsize=11)
+        segments = [[(x + 4, y - 0.5), (x + 4, y2 + 0.5)]
+                    for (x, y, _, _), (_, y2, _, _) in zip(boxes, boxes[1:])]
+        ax.add_collection(LineCollection(segments, colors='black', linewidths=1.5))
+        ax.scatter([seg[1][0] for seg in segments],
+                   [seg[1][1] for seg in segments],
+                   marker='v', color='black', s=40, zorder=3)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 12)
+        ax.set_aspect('auto')
+        ax.axis('off')
+        ax.set_title(title)
+
+    ax1.annotate('loops until the\nLLM says stop',
+                 xy=(5, 1.5), xytext=(6.5, 0.5),
+                 arrowprops=_ARROW_RED_BIDIR,
+                 fontsize=10, color='#e74c3c', fontweight='bold')
+
+    fig.tight_layout()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for ext in formats:
+        out = OUT / f'fig5_architecture_comparison.{ext}'
+        _print(fig, out, ext)
+        shutil.copy(out, cached[ext])
+
+
+def fig6_scaling_line(formats=('png',)):
+    categories = CATEGORIES
+    methods = METHODS
+    markers = ['o', 's', 's', '^', '^']
+    linestyles = ['-', '--', '--', ':', ':']
+
+    x = np.arange(len(categories))
+    fig, ax = _get_fig('fig6', (10, 6))
+    ax.clear()
+    # One plot dispatch for all methods (2-D y), then per-line styling.
+    lines = ax.plot(x, CAT_MATRIX.T, linewidth=2, markersize=7, rasterized=True)
+    for line, method, color, marker, ls in zip(lines, methods, METHOD_COLORS,
+                                               markers, linestyles):
+        line.set_color(color)
+        line.set_marker(marker)
+        line.set_linestyle(ls)
+        line.set_label(method)
+    lines[0].set_linewidth(4)
+    lines[0].set_markersize(12)
+    ax.annotate('flat as complexity grows',
+                xy=(3, CATEGORY_DATA['Workflow']['Manifesto']), xytext=(1.8, 3.2),
+                arrowprops=_ARROW_GREEN, bbox=_BBOX_GREEN,
+                fontsize=11, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.set_ylabel('Mean LLM calls per task')
+    ax.set_title('Call Count Scaling with Task Complexity')
+    ax.legend()
+    fig.tight_layout()
+    _save(fig, 'fig6_scaling_line', formats)
+
+
+def fig7_summary_table(formats=('png',)):
+    columns = ['Method', 'LLM Calls', 'Tokens', 'Cost ($)', 'Latency (s)', 'Success (%)']
+    rows = [
+        [m,
+         f"{OVERALL_DATA[m]['calls']:.1f}",
+         f"{OVERALL_DATA[m]['tokens']:,}",
+         f"{OVERALL_DATA[m]['cost']:.4f}",
+         f"{OVERALL_DATA[m]['latency']:.1f}",
+         f"{OVERALL_DATA[m]['success']}"]
+        for m in METHODS
+    ]
+
+    fig, ax = _get_fig('fig7', (12, 4))
+    ax.clear()
+    ax.axis('off')
+
+    # Static content: direct rectangles + text in one PatchCollection
+    # draw, skipping Table's per-cell style propagation and relayout.
+    col_widths = np.array([0.22, 0.15, 0.15, 0.16, 0.16, 0.16])
+    col_x = np.concatenate(([0.0], np.cumsum(col_widths)[:-1]))
+    row_height = 1.0 / (len(rows) + 1)
+    cells = []
+    facecolors = []
+    for r, row in enumerate([columns] + rows):
+        row_y = 1.0 - (r + 1) * row_height
+        header = r == 0
+        for cx, cw, text in zip(col_x, col_widths, row):
+            cells.append(mpatches.Rectangle((cx, row_y), cw, row_height))
+            facecolors.append('#34495e' if header
+                              else '#d5f5e3' if r == 1 else 'white')
+            ax.text(cx + cw / 2, row_y + row_height / 2, text,
+                    ha='center', va='center', fontsize=11,
+                    color='white' if header else 'black',
+                    fontweight='bold' if header else 'normal')
+    ax.add_collection(PatchCollection(
+        cells, facecolors=facecolors, edgecolors='#bdc3c7', linewidths=0.8))
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.set_title('Benchmark Summary', pad=20)
+    fig.tight_layout()
+    _save(fig, 'fig7_summary_table', formats)
+
+
+FIGURES = (
+    fig1_llm_calls_comparison,
+    fig2_calls_by_category,
+    fig3_cost_comparison,
+    fig4_latency_comparison,
+    fig5_architecture_comparison,
+    fig6_scaling_line,
+    fig7_summary_table,
+    fig_combined_overall,
+)
+
+# Default run renders the combined overview panel instead of fig1/3/4
+# individually; the per-figure wrappers stay reachable via --only for
+# paper sections that need them standalone.
+DEFAULT_FIGURES = (
+    fig_combined_overall,
+    fig2_calls_by_category,
+    fig5_architecture_comparison,
+    fig6_scaling_line,
+    fig7_summary_table,
+)
+
+
+def _run(job):
+    func, formats = job
+    func(formats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--formats', default='png',
+                        help='comma-separated output formats (default: png; '
+                             'use png,pdf for the camera-ready build)')
+    parser.add_argument('--both', action='store_true',
+                        help='shorthand for --formats png,pdf (camera-ready build)')
+    parser.add_argument('--only',
+                        help='comma-separated figure keys to render (e.g. fig1,fig3)')
+    parser.add_argument('--list', action='store_true',
+                        help='list figure names and exit')
+    parser.add_argument('--output-dir',
+                        help=f'directory to write figures to (default: {OUTPUT_DIR})')
+    parser.add_argument('--singlecore', action='store_true',
+                        help='render figures sequentially (for debugging)')
+    args = parser.parse_args()
+    formats = ('png', 'pdf') if args.both else tuple(args.formats.split(','))
+
+    if args.list:
+        for func in FIGURES:
+            print(func.__name__)
+        return
+
+    figures = DEFAULT_FIGURES
+    if args.only:
+        wanted = tuple(args.only.split(','))
+        figures = tuple(f for f in FIGURES
+                        if any(f.__name__.startswith(key) for key in wanted))
+
+    if args.output_dir:
+        _set_output_dir(args.output_dir)
+    ensure_output_dir()
+
+    jobs = [(func, formats) for func in figures]
+    if args.singlecore:
+        for job in jobs:
+            _run(job)
+    else:
+        # matplotlib is not thread-safe but is process-safe; each worker
+        # renders on its own Agg canvas with no shared state.
+        with multiprocessing.Pool(processes=min(len(FIGURES), os.cpu_count()),
+                                  initializer=_set_output_dir,
+                                  initargs=(OUTPUT_DIR,)) as pool:
+            pool.map(_run, jobs)
+
+    print(f'Wrote figures to {OUTPUT_DIR}:')
+    for entry in sorted(os.scandir(OUTPUT_DIR), key=lambda e: e.name):
+        print(f'  - {entry.name}')
+
+
+if __name__ == '__main__':
+    main()